@@ -5,10 +5,11 @@ import requests.utils
 
 from http import HTTPStatus
 from loguru import logger
-from typing import Optional
+from typing import Dict, Optional
 
 from j2toggl_core.configuration.jira_config import JiraConfig
 from j2toggl_core.domain.jira_issue import JiraIssue
+from j2toggl_core.utils.http_utils import create_session
 
 
 class JiraClient:
@@ -17,8 +18,9 @@ class JiraClient:
 
     def __init__(self, config: JiraConfig):
         self.__config = config
-        self.__session = requests.Session()
+        self.__session = create_session()
         self._user: Optional[JiraUser] = None
+        self._issues_cache: Dict[str, Optional[JiraIssue]] = {}
 
     def login(self) -> bool:
         if self._user is not None:
@@ -42,21 +44,32 @@ class JiraClient:
             os.unlink(self._cookieJarFileName)
 
     def search_issue(self, key: str) -> Optional[JiraIssue]:
+        if key in self._issues_cache:
+            return self._issues_cache[key]
+
         method_uri = self.__make_api_uri("issue/{0}".format(key))
         logger.debug("{0}: Request method: {1}".format("search_issue", method_uri))
         r = self.__session.get(url=method_uri)
 
         if r.status_code != 200:
             logger.error("{0}: status {1}, error {2}".format("search_issue", r.status_code, r.text))
+
+            # Remember missing issues to avoid repeated requests with the same bad key
+            if r.status_code == HTTPStatus.NOT_FOUND:
+                self._issues_cache[key] = None
+
             return None
         else:
-            return JiraIssue.parse(r.text)
+            issue = JiraIssue.parse(r.json())
+            self._issues_cache[key] = issue
+            return issue
 
     def search_issues(self, keys):
         method_uri = self.__make_api_uri("search")
         keys_str = self._jql_separator.join(keys)
         body = dict(
             jql=u"key IN (" + keys_str + ")",
+            maxResults=len(keys),
             fields=[
                 "key",
                 "summary",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import datetime
-import dateutil.parser
+import orjson
 import requests
 import urllib.parse
 
@@ -12,22 +12,50 @@ from j2toggl_core.exceptions.SyncException import SyncException
 from j2toggl_core.configuration.jira_config import JiraConfig
 from j2toggl_core.configuration.tempo_config import TempoConfig
 from j2toggl_core.jira_api_client import JiraClient
+from j2toggl_core.utils.http_utils import create_session
 from j2toggl_core.worklog import WorkLog
-from typing import List
+from typing import Dict, Iterator, List
 
 WorkLogCollection = List[WorkLog]
 
+_loads = orjson.loads
+_dumps = orjson.dumps
+
+# Activities come from a small set of values, so their encoded forms are cached in both directions
+_encoded_activities: Dict[str, str] = {}
+_decoded_activities: Dict[str, str] = {}
+
+
+def _encode_activity(value: str) -> str:
+    result = _encoded_activities.get(value)
+    if result is None:
+        result = urllib.parse.quote(value, safe='')
+        _encoded_activities[value] = result
+
+    return result
+
+
+def _decode_activity(value: str) -> str:
+    result = _decoded_activities.get(value)
+    if result is None:
+        result = urllib.parse.unquote(value)
+        _decoded_activities[value] = result
+
+    return result
+
 
 class TempoClient(JiraClient):
 
     __tempo_legacy_rest_api_url = "https://api.tempo.io/core"
     __PAGE_SIZE = 50
+    __JSON_HEADERS = {"Content-Type": "application/json"}
 
     def __init__(self, jira_config: JiraConfig, tempo_config: TempoConfig):
         JiraClient.__init__(self, jira_config)
 
         self.__config = tempo_config
-        self.__session = requests.Session()
+        self.__session = create_session()
+        self.__worklogs_uri = self.__make_tempo_api_uri("worklogs")
 
     def login(self) -> bool:
         if not super().login():
@@ -38,51 +66,56 @@ class TempoClient(JiraClient):
         return True
 
     def get_worklogs(self, start_date: datetime, end_date: datetime) -> WorkLogCollection:
-        method_uri = self.__make_tempo_api_uri(f"worklogs/user/{self._user.account_id}")
-
-        page_index = 0
+        return list(self.iter_worklogs(start_date, end_date))
 
-        tsr_list = []
+    def iter_worklogs(self, start_date: datetime, end_date: datetime) -> Iterator[WorkLog]:
+        method_uri = self.__make_tempo_api_uri(f"worklogs/user/{self._user.account_id}")
 
-        while True:
-            params = {
-                "from": start_date.strftime("%Y-%m-%d"),  # only dates, for instance "2016-12-23"
-                "to": end_date.strftime("%Y-%m-%d"),
-                "offset": page_index * self.__PAGE_SIZE,
-                "limit": self.__PAGE_SIZE
-            }
+        dates = {
+            "from": start_date.strftime("%Y-%m-%d"),  # only dates, for instance "2016-12-23"
+            "to": end_date.strftime("%Y-%m-%d"),
+        }
 
-            r = self.__session.get(url=method_uri, params=params)
-            if r.status_code != HTTPStatus.OK:
-                error_message = "{method_name}: url: {url} status {error_code}, error {error_message}".format(
-                    method_name="get_worklogs",
-                    url=method_uri,
-                    error_code=r.status_code,
-                    error_message=r.text)
+        report = self.__get_worklogs_report(method_uri, dates, 0)
+        yield from self._load_worklogs_page(report["results"])
 
-                logger.error(error_message)
-                raise SyncException(error_message)
+        page_index = 1
 
-            report = r.json()
+        # Tempo provides link to the next page only if it exists, so there is no extra request for the empty page
+        while report["metadata"].get("next") and report["results"]:
+            report = self.__get_worklogs_report(method_uri, dates, page_index * self.__PAGE_SIZE)
+            yield from self._load_worklogs_page(report["results"])
 
-            records_count = report["metadata"]["count"]
-            if not isinstance(records_count, int):
-                raise SyncException("Page count metadata MUST BE integer")
+            page_index += 1
 
-            worklogs_part = self._load_worklogs_page(report["results"])
-            tsr_list.extend(worklogs_part)
+    def __get_worklogs_report(self, method_uri: str, dates: dict, offset: int) -> dict:
+        params = {
+            **dates,
+            "offset": offset,
+            "limit": self.__PAGE_SIZE
+        }
 
-            page_index += 1
+        r = self.__session.get(url=method_uri, params=params)
+        if r.status_code != HTTPStatus.OK:
+            error_message = "{method_name}: url: {url} status {error_code}, error {error_message}".format(
+                method_name="iter_worklogs",
+                url=method_uri,
+                error_code=r.status_code,
+                error_message=r.text)
 
-            if records_count < self.__PAGE_SIZE:
-                break
+            logger.error(error_message)
+            raise SyncException(error_message)
 
-        return tsr_list
+        return _loads(r.content)
 
     @staticmethod
     def _load_worklogs_page(tempo_worklogs: dict) -> WorkLogCollection:
         tsrs = []
 
+        # Local names are cheaper than global and attribute lookups in the per-record loop
+        append = tsrs.append
+        decode_activity = _decode_activity
+
         for tempo_record in tempo_worklogs:
             wl = WorkLog()
 
@@ -92,32 +125,26 @@ class TempoClient(JiraClient):
             wl.description = tempo_record["description"]
 
             # Times
-            duration = tempo_record["timeSpentSeconds"]
-            start = dateutil.parser.parse(tempo_record["startDate"] + "T" + tempo_record["startTime"])
-            end = start + datetime.timedelta(seconds=duration)
-
-            wl.startTime = start
-            wl.endTime = end
-            wl.duration = duration
+            wl.duration = tempo_record["timeSpentSeconds"]
+            wl.set_raw_start_time(tempo_record["startDate"] + "T" + tempo_record["startTime"])
 
             # Attributes
-            if tempo_record["attributes"] and tempo_record["attributes"]["values"]:
-                attributes = tempo_record["attributes"]["values"]
-                activity_attr = next((x for x in attributes if x["key"] == "_Activity_"), None)
-                if activity_attr is not None:
-                    wl.activity = urllib.parse.unquote(activity_attr["value"])
+            if (attributes := tempo_record["attributes"]) and (attributes := attributes["values"]):
+                attributes_map = {x["key"]: x.get("value") for x in attributes}
+                if (activity := attributes_map.get("_Activity_")) is not None:
+                    wl.activity = decode_activity(activity)
 
-            tsrs.append(wl)
+            append(wl)
 
         return tsrs
 
     def add_worklog(self, worklog: WorkLog):
-        method_uri = self.__make_tempo_api_uri("worklogs")
+        method_uri = self.__worklogs_uri
 
         data = self.__worklog_to_dict(worklog)
-        r = self.__session.post(url=method_uri, json=data)
+        r = self.__post_json(method_uri, data)
         if r.status_code == HTTPStatus.OK:
-            answer = r.json()
+            answer = _loads(r.content)
             worklog.second_id = int(answer["tempoWorklogId"])
         else:
             logger.error("{method_name}: url: {url} status {error_code}, error {error_message}"
@@ -130,12 +157,12 @@ class TempoClient(JiraClient):
         return True
 
     def update_worklog(self, worklog: WorkLog):
-        method_uri = self.__make_tempo_api_uri("worklogs/{worklog_id}".format(worklog_id=worklog.second_id))
+        method_uri = f"{self.__worklogs_uri}/{worklog.second_id}"
 
         data = self.__worklog_to_dict(worklog)
-        r = self.__session.put(url=method_uri, json=data)
+        r = self.__put_json(method_uri, data)
         if r.status_code == HTTPStatus.OK:
-            answer = r.json()
+            answer = _loads(r.content)
             worklog.second_id = int(answer["tempoWorklogId"])
         else:
             logger.error("{method_name}: url: {url} status {error_code}, error {error_message}"
@@ -148,24 +175,32 @@ class TempoClient(JiraClient):
         return True
 
     def delete_worklog(self, worklog: WorkLog):
-        method_uri = self.__make_tempo_api_uri("worklogs/{worklog_id}".format(worklog_id=worklog.second_id))
+        method_uri = f"{self.__worklogs_uri}/{worklog.second_id}"
 
         r = self.__session.delete(url=method_uri)
         return r.ok
 
+    def __post_json(self, method_uri: str, data: dict) -> requests.Response:
+        return self.__session.post(url=method_uri, data=_dumps(data), headers=self.__JSON_HEADERS)
+
+    def __put_json(self, method_uri: str, data: dict) -> requests.Response:
+        return self.__session.put(url=method_uri, data=_dumps(data), headers=self.__JSON_HEADERS)
+
     def __worklog_to_dict(self, worklog: WorkLog) -> dict:
+        st = worklog.startTime
+
         data = {
             "issueKey": worklog.key,
             "timeSpentSeconds": worklog.duration,
-            "startDate": worklog.startTime.strftime("%Y-%m-%d"),
-            "startTime": worklog.startTime.strftime("%H:%M:00"),
+            "startDate": f"{st.year:04d}-{st.month:02d}-{st.day:02d}",
+            "startTime": f"{st.hour:02d}:{st.minute:02d}:00",
             "description": worklog.description,
             "authorAccountId": self._user.account_id,
             "attributes": [
                 {
                     "key": "_Activity_",
                     # Tempo still required that attribute names should be encoded
-                    "value": urllib.parse.quote(worklog.activity, safe='')
+                    "value": _encode_activity(worklog.activity)
                 },
             ],
         }
@@ -2,6 +2,7 @@
 
 
 from datetime import datetime, date
+import dateutil.parser
 import pytz
 import tzlocal
 
@@ -23,3 +24,11 @@ def date2datetime(d: date):
     local_zone = tzlocal.get_localzone()
     result = datetime(year=d.year, month=d.month, day=d.day, tzinfo=local_zone)
     return result
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    # Fast path for ISO-8601 values, dateutil is used only as a fallback
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return dateutil.parser.parse(value)
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session() -> requests.Session:
+    # POST is not retried because it is not idempotent: a retried request could add the same worklog twice
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"]))
+
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+
+    return session
@@ -2,6 +2,9 @@
 
 import re
 
+from datetime import timedelta
+
+from j2toggl_core.utils.datetime_utils import parse_iso_datetime
 from j2toggl_core.worklog_state import WorkLogState
 
 
@@ -17,13 +20,47 @@ class WorkLog:
 
         self.project = None
         self.description = None
-        self.startTime = None
-        self.endTime = None
+        self._raw_start_time = None
+        self._start_time = None
+        self._end_time = None
         self.duration = None
         self.tags = None
 
         self.tooltip = None
 
+    @property
+    def startTime(self):
+        if self._start_time is None and self._raw_start_time is not None:
+            self._start_time = parse_iso_datetime(self._raw_start_time)
+
+        return self._start_time
+
+    @startTime.setter
+    def startTime(self, value):
+        # Keep end time which was derived from the previous raw start time
+        if self._raw_start_time is not None:
+            self._end_time = self.endTime
+
+        self._start_time = value
+        self._raw_start_time = None
+
+    @property
+    def endTime(self):
+        if self._end_time is None and self._raw_start_time is not None and self.duration is not None:
+            self._end_time = self.startTime + timedelta(seconds=self.duration)
+
+        return self._end_time
+
+    @endTime.setter
+    def endTime(self, value):
+        self._end_time = value
+
+    def set_raw_start_time(self, value: str):
+        # Start and end times are parsed only on first access, many sync flows never read them
+        self._raw_start_time = value
+        self._start_time = None
+        self._end_time = None
+
     @property
     def is_invalid(self):
         result = self.key is None \
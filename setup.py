@@ -40,7 +40,9 @@ REQUIRED = [
     "requests >= 2.12.4,<3.0",
     "sip >=5.1.1",
     "tzlocal >=2.1,<3.0",
+    "urllib3 >=1.26.0",
     "loguru >=0.7.2,<0.8.0",
+    "orjson >=3.9,<4.0",
 ]
 
 here = os.path.abspath(os.path.dirname(__file__))
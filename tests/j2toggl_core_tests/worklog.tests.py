@@ -0,0 +1,63 @@
+import unittest
+
+from datetime import datetime
+
+from j2toggl_core.worklog import WorkLog
+
+
+class WorkLog_Tests(unittest.TestCase):
+
+    def test_raw_start_time_should_be_parsed_on_first_access(self):
+        worklog = WorkLog()
+        worklog.set_raw_start_time("2020-10-29T17:15:00")
+
+        self.assertIsNone(worklog._start_time, "start time should not be parsed before access.")
+        self.assertEqual(datetime(2020, 10, 29, 17, 15), worklog.startTime)
+
+    def test_end_time_should_be_derived_from_raw_start_time_and_duration(self):
+        worklog = WorkLog()
+        worklog.duration = 15 * 60
+        worklog.set_raw_start_time("2020-10-29T17:15:00")
+
+        self.assertEqual(datetime(2020, 10, 29, 17, 30), worklog.endTime)
+
+    def test_end_time_without_duration_should_be_null(self):
+        worklog = WorkLog()
+        worklog.set_raw_start_time("2020-10-29T17:15:00")
+
+        self.assertIsNone(worklog.endTime, "end time should be null when duration is unknown.")
+
+    def test_set_start_time_after_raw_start_time_should_keep_derived_end_time(self):
+        worklog = WorkLog()
+        worklog.duration = 15 * 60
+        worklog.set_raw_start_time("2020-10-29T17:15:00")
+
+        worklog.startTime = datetime(2020, 10, 30, 9, 0)
+
+        self.assertEqual(datetime(2020, 10, 30, 9, 0), worklog.startTime)
+        self.assertEqual(datetime(2020, 10, 29, 17, 30), worklog.endTime)
+
+    def test_set_start_time_after_raw_start_time_without_duration_should_not_fail(self):
+        worklog = WorkLog()
+        worklog.set_raw_start_time("2020-10-29T17:15:00")
+
+        worklog.startTime = datetime(2020, 10, 30, 9, 0)
+
+        self.assertEqual(datetime(2020, 10, 30, 9, 0), worklog.startTime)
+        self.assertIsNone(worklog.endTime, "end time should be null when duration is unknown.")
+
+    def test_assigned_times_should_be_returned_as_is(self):
+        start = datetime(2020, 10, 29, 17, 15)
+        end = datetime(2020, 10, 29, 17, 30)
+
+        worklog = WorkLog()
+        worklog.startTime = start
+        worklog.endTime = end
+        worklog.duration = 5 * 60
+
+        self.assertEqual(start, worklog.startTime)
+        self.assertEqual(end, worklog.endTime)
+
+
+if __name__ == '__main__':
+    unittest.main()
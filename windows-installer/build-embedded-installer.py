@@ -27,6 +27,9 @@ pip_path = str(env_dir.joinpath("pip.exe").resolve())
 dist_dir = source_dir.joinpath("dist")
 package_dir = dist_dir.joinpath("package")
 libs_dir = package_dir.joinpath("libs")
+wheelhouse_dir = dist_dir.joinpath("wheelhouse")
+wheelhouse_stamp_path = dist_dir.joinpath("wheelhouse.sha256")
+requirements_path = source_dir.joinpath("requirements.txt")
 
 
 @contextmanager
@@ -130,23 +133,23 @@ if not package_dir.exists():
     package_dir.mkdir()
 
 # === Download Python Embedded dist package ===
+# Hash sum is calculated while the package is downloaded, so the file isn't read twice
 print("Download Python Embedded dist package ...")
-if not python_embedded_file_path.exists():
-    urllib.request.urlretrieve(python_embedded_url, python_embedded_file_path)
-
-# Check hash sum
-print("Check hash sum ...")
-h = hashlib.sha256()
-
-with python_embedded_file_path.open(mode="rb") as f:
-    while True:
-        block = f.read(2048)
-        if len(block) == 0:
-            break
-
-        h.update(block)
-
-h.digest()
+if python_embedded_file_path.exists():
+    print("Check hash sum of cached package ...")
+    with python_embedded_file_path.open(mode="rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            h = hashlib.file_digest(f, "sha256")
+        else:
+            h = hashlib.sha256()
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+else:
+    h = hashlib.sha256()
+    with urllib.request.urlopen(python_embedded_url) as response, python_embedded_file_path.open(mode="wb") as f:
+        for block in iter(lambda: response.read(1 << 20), b""):
+            h.update(block)
+            f.write(block)
 
 current_hash_sum = h.hexdigest()
 if python_embedded_file_hash_sum != current_hash_sum:
@@ -160,22 +163,7 @@ print("Prepare Python embedded dist ...")
 with zipfile.ZipFile(python_embedded_file_path, 'r') as zip_ref:
     zip_ref.extractall(package_dir)
 
-# Rename archive with Python bytecode
-python_pyc_archive = package_dir.joinpath(f"{python_embedded_version}.zip")
-python_pyc_archive = python_pyc_archive.rename(python_pyc_archive.with_name(f"_{python_embedded_version}.zip"))
-
-# Create dir for Python bytecode
-python_pyc_dir = package_dir.joinpath(f"{python_embedded_version}.zip")
-python_pyc_dir.mkdir()
-
-# Unzip the archive of Python bytecode
-with zipfile.ZipFile(python_pyc_archive, 'r') as zip_ref:
-    zip_ref.extractall(python_pyc_dir)
-
-# Remove original archive of Python bytecode
-python_pyc_archive.unlink()
-
-# Update file of Python paths
+# Update file of Python paths. Archive with Python bytecode isn't unpacked, zipimport loads modules from it
 path_file = package_dir.joinpath(f"{python_embedded_version}._pth")
 with path_file.open(mode="w", encoding="utf-8") as f:
     f.write(f"""
@@ -186,21 +174,46 @@ libs
 import site
 """)
 
+# === Download requirements to local wheelhouse ===
+# Wheelhouse is refreshed only when requirements are changed, the stamp file keeps hash sum of them.
+# Download doesn't depend on the wheel, so it runs concurrently with the build
+requirements_hash_sum = hashlib.sha256(requirements_path.read_bytes()).hexdigest()
+wheelhouse_hash_sum = wheelhouse_stamp_path.read_text(encoding="ascii").strip() \
+    if wheelhouse_stamp_path.exists() else None
+
+download_process = None
+if not wheelhouse_dir.exists() or wheelhouse_hash_sum != requirements_hash_sum:
+    print("Download requirements to wheelhouse ...")
+    wheelhouse_stamp_path.unlink(missing_ok=True)
+    shutil.rmtree(wheelhouse_dir, ignore_errors=True)
+    download_process = subprocess.Popen([pip_path, 'download', "-d", wheelhouse_dir, "-r", requirements_path])
+
 # === Build wheel distribution package ===
 print("Build Wheel distribution packages ...")
 with pushd(source_dir):
-    bdist_process = subprocess.run([python_path, '-m', "build", "--wheel"],
-                                   stdout=subprocess.PIPE,
-                                   universal_newlines=True)
+    bdist_process = subprocess.run([python_path, '-m', "build", "--wheel"])
     if bdist_process.returncode != 0:
+        if download_process is not None:
+            download_process.kill()
+            download_process.wait()
+            shutil.rmtree(wheelhouse_dir, ignore_errors=True)
+
         exit(bdist_process.returncode)
 
+if download_process is not None:
+    if download_process.wait() != 0:
+        shutil.rmtree(wheelhouse_dir, ignore_errors=True)
+        exit(download_process.returncode)
+
+    wheelhouse_stamp_path.write_text(requirements_hash_sum, encoding="ascii")
+
 # === Install application and requirements ===
+# Bytecode isn't compiled because __pycache__ directories are removed from the package anyway
 print("Install application and requirements ...")
 wheel_package_path = dist_dir.joinpath(f"toggl2tempo-{version}-py3-none-any.whl")
-pip_process = subprocess.run([pip_path, 'install', "-t", libs_dir, wheel_package_path],
-                             stdout=subprocess.PIPE,
-                             universal_newlines=True)
+pip_process = subprocess.run([pip_path, 'install', "--no-compile", "--no-build-isolation",
+                              "--no-index", "--find-links", wheelhouse_dir,
+                              "-t", libs_dir, wheel_package_path])
 if pip_process.returncode != 0:
     exit(pip_process.returncode)
 
@@ -213,9 +226,7 @@ shutil.copy(source_dir.joinpath("main.py"), package_dir.joinpath(f"{app_name}.py
 
 # === Run NSIS to build Windows installer ===
 print("Make Windows installer ...")
-makensis_process = subprocess.run(['makensis.exe', 'embedded-installer.nsi'],
-                                  stdout=subprocess.PIPE,
-                                  universal_newlines=True)
+makensis_process = subprocess.run(['makensis.exe', 'embedded-installer.nsi'])
 if makensis_process.returncode != 0:
     exit(makensis_process.returncode)
 